@@ -0,0 +1,49 @@
+"""AWS Connect Vanify export main."""
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from .history import HistoryExporter
+
+app = typer.Typer(name="aws-connect-vanify-export")
+
+
+@app.command()
+def history(
+    output_dir: Path = typer.Argument(..., help="Directory to write segment files to."),
+    total_segments: int = typer.Option(4, help="Parallel scan segments."),
+    workers: Optional[int] = typer.Option(None, help="Worker threads, defaults to segments."),
+    output_format: str = typer.Option("jsonl", "--format", help="Output format, `jsonl` or `csv`."),
+    page_size: int = typer.Option(100, help="Items per scanned page."),
+):
+    """Export vanify caller/result history, resuming any previous export."""
+    typer.secho(
+        f"Exporting history to {output_dir} ({total_segments} segments)",
+        bold=True,
+        fg=typer.colors.BRIGHT_WHITE,
+    )
+    exporter = HistoryExporter(
+        output_dir=output_dir,
+        total_segments=total_segments,
+        workers=workers,
+        output_format=output_format,
+        page_size=page_size,
+    )
+    report = exporter.run()
+    if report.resumed:
+        typer.secho(f"Resumed {report.resumed} segments.", fg=typer.colors.BRIGHT_YELLOW)
+    typer.secho(
+        f"Exported {report.total_items} items in {report.elapsed:.2f}s "
+        f"({report.items_per_second:.2f} items/s)",
+        fg=typer.colors.BRIGHT_GREEN,
+    )
+
+
+@app.callback()
+def main():
+    """AWS Connect Vanify export helper."""
+
+
+if __name__ == "__main__":
+    app()
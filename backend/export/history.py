@@ -0,0 +1,225 @@
+"""AWS Connect Vanify history export."""
+
+import csv
+import io
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, ClassVar, Dict, Literal, Optional, TextIO, Type
+
+import attr
+from vanify.models import VanifyModel
+
+ExportFormat = Literal["jsonl", "csv"]
+
+CHECKPOINT_NAME = "checkpoint.json"
+
+
+@attr.s(auto_attribs=True)
+class SegmentState:
+    """Resume state of a single scan segment."""
+
+    last_evaluated_key: Optional[Dict[str, Dict[str, Any]]] = None
+    # size of the segment's output file at `last_evaluated_key`.
+    offset: int = 0
+    items: int = 0
+    done: bool = False
+
+
+@attr.s(auto_attribs=True)
+class ExportCheckpoint:
+    """Per-segment resume state, persisted after every scanned page."""
+
+    path: Path
+    total_segments: int
+    output_format: str = "jsonl"
+    segments: Dict[int, SegmentState] = attr.ib(factory=dict)
+    _lock: threading.Lock = attr.ib(factory=threading.Lock, repr=False)
+
+    @classmethod
+    def load(
+        cls, path: Path, total_segments: int, output_format: str = "jsonl"
+    ) -> "ExportCheckpoint":
+        """Load checkpoint from `path`, or create a new one.
+
+        Raises:
+            ValueError: Existing checkpoint was made with different total segments
+                or output format.
+
+        """
+        checkpoint = cls(path=path, total_segments=total_segments, output_format=output_format)
+        if path.exists():
+            data = json.loads(path.read_text())
+            if data["total_segments"] != total_segments:
+                raise ValueError(
+                    f"Checkpoint was created with {data['total_segments']} segments, "
+                    f"got {total_segments}."
+                )
+            if data.get("output_format") != output_format:
+                raise ValueError(
+                    f"Checkpoint was created with {data.get('output_format')} output, "
+                    f"got {output_format}."
+                )
+            checkpoint.segments = {
+                int(seg): SegmentState(**state) for seg, state in data["segments"].items()
+            }
+        for seg in range(total_segments):
+            checkpoint.segments.setdefault(seg, SegmentState())
+        return checkpoint
+
+    def update(self, segment: int, state: SegmentState):
+        """Record `state` for `segment` and persist the checkpoint."""
+        with self._lock:
+            self.segments[segment] = state
+            data = dict(
+                total_segments=self.total_segments,
+                output_format=self.output_format,
+                segments={seg: attr.asdict(s) for seg, s in self.segments.items()},
+            )
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data))
+            tmp_path.replace(self.path)
+
+
+class ItemWriter(ABC):
+    """Streams serialized items to a file."""
+
+    suffix: ClassVar[str]
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    @abstractmethod
+    def write(self, item: Dict[str, Any]):
+        ...
+
+
+class JsonLinesWriter(ItemWriter):
+    suffix = "jsonl"
+
+    def write(self, item: Dict[str, Any]):
+        self.stream.write(json.dumps(item) + "\n")
+
+
+class CsvWriter(ItemWriter):
+    suffix = "csv"
+    columns = ("contact_id", "caller_id", "date", "input", "results")
+
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self._writer = csv.DictWriter(stream, fieldnames=self.columns, extrasaction="ignore")
+        if stream.tell() == 0:
+            self._writer.writeheader()
+
+    def write(self, item: Dict[str, Any]):
+        item = dict(item, results=json.dumps(item.get("results", [])))
+        self._writer.writerow(item)
+
+
+WRITERS: Dict[str, Type[ItemWriter]] = {w.suffix: w for w in (JsonLinesWriter, CsvWriter)}
+
+
+@attr.s(auto_attribs=True)
+class ExportReport:
+    """Export throughput summary."""
+
+    segment_items: Dict[int, int]
+    elapsed: float
+    resumed: int = 0
+
+    @property
+    def total_items(self) -> int:
+        return sum(self.segment_items.values())
+
+    @property
+    def items_per_second(self) -> float:
+        return self.total_items / self.elapsed if self.elapsed else 0.0
+
+
+@attr.s(auto_attribs=True)
+class HistoryExporter:
+    """Export vanify history with a DynamoDB parallel scan.
+
+    Each segment is scanned by its own worker and streamed page by page
+    into its own output file, so the table is never held in memory.
+    Segment progress is checkpointed after every page, allowing an
+    interrupted export to resume where each segment left off.
+
+    """
+
+    output_dir: Path
+    total_segments: int = 4
+    workers: Optional[int] = None
+    output_format: ExportFormat = attr.ib(default="jsonl", validator=attr.validators.in_(WRITERS))
+    page_size: int = 100
+    model: Any = VanifyModel
+    on_page: Optional[Callable[[int, int], None]] = None
+
+    def segment_path(self, segment: int) -> Path:
+        suffix = WRITERS[self.output_format].suffix
+        return self.output_dir / f"segment-{segment:04d}.{suffix}"
+
+    def export_segment(self, segment: int, checkpoint: ExportCheckpoint) -> int:
+        """Scan and export a single segment.
+
+        Returns:
+            Items exported by this run.
+
+        """
+        state = checkpoint.segments[segment]
+        path = self.segment_path(segment)
+        if not path.exists() or path.stat().st_size < state.offset:
+            # output was lost since the checkpoint, so the segment starts over.
+            state = SegmentState()
+        if state.done:
+            return 0
+        exported = 0
+        with path.open("a+", newline="") as stream:
+            # drop items written after the last checkpoint.
+            stream.truncate(state.offset)
+            stream.seek(state.offset, io.SEEK_SET)
+            writer = WRITERS[self.output_format](stream)
+            while not state.done:
+                results = self.model.scan(
+                    segment=segment,
+                    total_segments=self.total_segments,
+                    last_evaluated_key=state.last_evaluated_key,
+                    limit=self.page_size,
+                    page_size=self.page_size,
+                )
+                page_items = 0
+                for item in results:
+                    writer.write(item.as_dict())
+                    page_items += 1
+                stream.flush()
+                exported += page_items
+                state = SegmentState(
+                    last_evaluated_key=results.last_evaluated_key,
+                    offset=stream.tell(),
+                    items=state.items + page_items,
+                    done=results.last_evaluated_key is None,
+                )
+                checkpoint.update(segment, state)
+                if self.on_page:
+                    self.on_page(segment, page_items)
+        return exported
+
+    def run(self) -> ExportReport:
+        """Export all segments, resuming from any existing checkpoint."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint = ExportCheckpoint.load(
+            self.output_dir / CHECKPOINT_NAME, self.total_segments, self.output_format
+        )
+        resumed = sum(1 for s in checkpoint.segments.values() if s.items or s.done)
+        start = time.perf_counter()
+        segments = range(self.total_segments)
+        with ThreadPoolExecutor(max_workers=self.workers or self.total_segments) as pool:
+            exported = list(pool.map(lambda s: self.export_segment(s, checkpoint), segments))
+        return ExportReport(
+            segment_items=dict(zip(segments, exported)),
+            elapsed=time.perf_counter() - start,
+            resumed=resumed,
+        )
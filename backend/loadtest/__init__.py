@@ -0,0 +1,5 @@
+"""Top-level package for aws-connect vanify load testing."""
+
+__author__ = """Braden Mars"""
+__email__ = "bradenmars@bradenmars.me"
+__version__ = "0.1.0"
@@ -0,0 +1,38 @@
+"""AWS Connect Vanify load test main."""
+from typing import Optional
+
+import typer
+
+from .harness import run_load_test
+
+app = typer.Typer(name="aws-connect-vanify-loadtest")
+
+
+@app.command()
+def run(
+    requests: int = typer.Option(100, help="Total number of calls."),
+    concurrency: int = typer.Option(4, help="Worker processes, 0 runs in-process."),
+    recent_ratio: float = typer.Option(0.1, help="Fraction of calls made to `recent`."),
+    cold_start: bool = typer.Option(False, help="Re-import the app before every call."),
+    seed: Optional[int] = typer.Option(None, help="Random seed for generated events."),
+):
+    """Replay generated connect events against the vanify handlers."""
+    typer.secho(
+        f"Running {requests} calls @ concurrency {concurrency}",
+        bold=True,
+        fg=typer.colors.BRIGHT_WHITE,
+    )
+    report = run_load_test(
+        requests, concurrency, recent_ratio=recent_ratio, cold_start=cold_start, seed=seed
+    )
+    typer.echo(report.render())
+    typer.secho("Load test complete!", fg=typer.colors.BRIGHT_GREEN)
+
+
+@app.callback()
+def main():
+    """AWS Connect Vanify load test helper."""
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,319 @@
+"""AWS Connect Vanify load test harness."""
+
+import copy
+import importlib
+import json
+import logging
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+import traceback
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterator, List, Literal, Optional, Tuple
+
+import attr
+
+from .store import InMemoryVanifyModel
+
+HandlerName = Literal["handler", "recent"]
+
+MOCK_EVENT_PATH = Path(__file__).parent.parent / "mock.json"
+
+# latency histogram upper bounds, in milliseconds.
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float("inf"))
+
+RECENT_EVENT = {"httpMethod": "GET", "path": "/recent"}
+
+
+def random_us_number(rng: random.Random) -> str:
+    """Create a random, validly formatted, E164 US phone number."""
+    area = f"{rng.randint(2, 9)}{rng.randint(0, 99):02d}"
+    exchange = f"{rng.randint(2, 9)}{rng.randint(0, 99):02d}"
+    line = f"{rng.randint(0, 9999):04d}"
+    return f"+1{area}{exchange}{line}"
+
+
+def build_event(input_number: str, caller_id: str, contact_id: Optional[str] = None):
+    """Create a connect contact flow event from the `mock.json` template.
+
+    Args:
+        input_number: number to vanify.
+        caller_id: caller endpoint address.
+        contact_id: contact id. Defaults to a random uuid.
+
+    Returns:
+        Connect contact flow event.
+
+    """
+    event = json.loads(MOCK_EVENT_PATH.read_text())
+    contact_data = event["Details"]["ContactData"]
+    contact_data["ContactId"] = contact_id or str(uuid.uuid4())
+    contact_data["InitialContactId"] = contact_data["ContactId"]
+    contact_data["CustomerEndpoint"]["Address"] = caller_id
+    event["Details"]["Parameters"]["inputNumber"] = input_number
+    return event
+
+
+def generate_calls(
+    requests: int, recent_ratio: float = 0.0, seed: Optional[int] = None
+) -> Iterator[Tuple[HandlerName, Dict]]:
+    """Generate handler calls with varied input numbers and callers.
+
+    Args:
+        requests: number of calls to generate.
+        recent_ratio: fraction of calls that should hit `app.recent`.
+        seed: random seed, for reproducible runs.
+
+    Yields:
+        Handler name and event pairs.
+
+    """
+    rng = random.Random(seed)
+    template = build_event("", "")
+    for _ in range(requests):
+        if rng.random() < recent_ratio:
+            yield "recent", dict(RECENT_EVENT)
+            continue
+        event = copy.deepcopy(template)
+        contact_data = event["Details"]["ContactData"]
+        contact_data["ContactId"] = str(uuid.UUID(int=rng.getrandbits(128)))
+        contact_data["InitialContactId"] = contact_data["ContactId"]
+        contact_data["CustomerEndpoint"]["Address"] = random_us_number(rng)
+        event["Details"]["Parameters"]["inputNumber"] = random_us_number(rng)
+        yield "handler", event
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class WorkerSpec:
+    """Work assigned to a single load test worker."""
+
+    worker_id: int
+    calls: List[Tuple[HandlerName, Dict]]
+    cold_start: bool = False
+
+
+@attr.s(auto_attribs=True)
+class WorkerResult:
+    """Measurements collected by a single load test worker."""
+
+    worker_id: int
+    pid: int
+    latencies: Dict[str, List[float]] = attr.ib(factory=dict)
+    import_seconds: List[float] = attr.ib(factory=list)
+    errors: int = 0
+    # first traceback raised by each handler.
+    error_tracebacks: Dict[str, str] = attr.ib(factory=dict)
+    max_rss_kb: int = 0
+
+
+@contextmanager
+def quiet_logging():
+    """Silence per-call info logs and drop handlers added by re-imports.
+
+    Yields a function to call after every app import. Logger levels and
+    handlers seen on the first call are restored on exit.
+
+    """
+    saved: Dict[str, Tuple[int, List[logging.Handler]]] = {}
+
+    def _quiet():
+        for name in ("vanify.app", "vanify.convert"):
+            logger = logging.getLogger(name)
+            level, handlers = saved.setdefault(name, (logger.level, list(logger.handlers)))
+            logger.setLevel(logging.WARNING)
+            del logger.handlers[len(handlers) :]
+
+    try:
+        yield _quiet
+    finally:
+        for name, (level, handlers) in saved.items():
+            logger = logging.getLogger(name)
+            logger.setLevel(level)
+            logger.handlers[:] = handlers
+
+
+@contextmanager
+def isolated_modules():
+    """Restore vanify modules in `sys.modules` on exit.
+
+    Fresh imports replace the modules callers already hold, so any module
+    imported or dropped inside the block is reverted.
+
+    """
+    saved = {m: mod for m, mod in sys.modules.items() if m == "vanify" or m.startswith("vanify.")}
+    try:
+        yield
+    finally:
+        for name in [m for m in sys.modules if m == "vanify" or m.startswith("vanify.")]:
+            if name not in saved:
+                del sys.modules[name]
+        sys.modules.update(saved)
+
+
+def import_app(fresh: bool = False) -> Tuple[ModuleType, float]:
+    """Import the vanify app module.
+
+    Args:
+        fresh: drop cached vanify modules first, simulating a cold start.
+
+    Returns:
+        App module and seconds spent importing it.
+
+    """
+    if fresh:
+        for name in [m for m in sys.modules if m == "vanify" or m.startswith("vanify.")]:
+            del sys.modules[name]
+    start = time.perf_counter()
+    app = importlib.import_module("vanify.app")
+    elapsed = time.perf_counter() - start
+    return app, elapsed
+
+
+@contextmanager
+def patched_model(app: ModuleType):
+    """Swap the app's dynamodb model for the in-memory stand-in."""
+    original = app.VanifyModel
+    app.VanifyModel = InMemoryVanifyModel
+    try:
+        yield
+    finally:
+        app.VanifyModel = original
+
+
+def run_worker(spec: WorkerSpec) -> WorkerResult:
+    """Drive the vanify handlers with the calls in `spec`."""
+    result = WorkerResult(worker_id=spec.worker_id, pid=os.getpid())
+    InMemoryVanifyModel.reset()
+    with isolated_modules(), quiet_logging() as quiet:
+        app, import_time = import_app(fresh=spec.cold_start)
+        quiet()
+        result.import_seconds.append(import_time)
+        for idx, (name, event) in enumerate(spec.calls):
+            if spec.cold_start and idx:
+                app, import_time = import_app(fresh=True)
+                quiet()
+                result.import_seconds.append(import_time)
+            with patched_model(app):
+                start = time.perf_counter()
+                try:
+                    getattr(app, name)(event, None)
+                except Exception:
+                    result.errors += 1
+                    result.error_tracebacks.setdefault(name, traceback.format_exc())
+                elapsed = time.perf_counter() - start
+            result.latencies.setdefault(name, []).append(elapsed)
+    result.max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+
+@attr.s(auto_attribs=True)
+class LoadTestReport:
+    """Aggregated load test results."""
+
+    workers: List[WorkerResult]
+    elapsed: float
+
+    @property
+    def total_requests(self) -> int:
+        return sum(len(v) for w in self.workers for v in w.latencies.values())
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.total_requests / self.elapsed if self.elapsed else 0.0
+
+    def latencies(self, name: HandlerName) -> List[float]:
+        return sorted(lat for w in self.workers for lat in w.latencies.get(name, []))
+
+    @staticmethod
+    def percentile(values: List[float], pct: float) -> float:
+        """Nearest-rank percentile of sorted `values`."""
+        if not values:
+            return 0.0
+        rank = max(0, min(len(values) - 1, round(pct / 100 * len(values)) - 1))
+        return values[rank]
+
+    @staticmethod
+    def histogram(values: List[float]) -> List[Tuple[float, int]]:
+        """Bucket latencies by `HISTOGRAM_BOUNDS_MS` upper bounds."""
+        counts = [0] * len(HISTOGRAM_BOUNDS_MS)
+        for value in values:
+            value_ms = value * 1000
+            idx = next(i for i, b in enumerate(HISTOGRAM_BOUNDS_MS) if value_ms <= b)
+            counts[idx] += 1
+        return list(zip(HISTOGRAM_BOUNDS_MS, counts))
+
+    def render(self) -> str:
+        """Render report as plain text."""
+        lines = [
+            f"requests: {self.total_requests} in {self.elapsed:.2f}s "
+            f"({self.requests_per_second:.2f} req/s)",
+            f"errors: {sum(w.errors for w in self.workers)}",
+        ]
+        for name in ("handler", "recent"):
+            values = self.latencies(name)
+            if not values:
+                continue
+            lines.append(
+                f"{name}: n={len(values)} mean={statistics.mean(values) * 1000:.1f}ms "
+                + " ".join(f"p{p}={self.percentile(values, p) * 1000:.1f}ms" for p in (50, 90, 99))
+            )
+            for bound, count in self.histogram(values):
+                if count:
+                    label = f"<={bound:g}ms" if bound != float("inf") else ">5000ms"
+                    lines.append(f"  {label:>9} {count:>6} {'#' * min(count, 60)}")
+        for w in self.workers:
+            imports = statistics.mean(w.import_seconds) * 1000 if w.import_seconds else 0.0
+            lines.append(
+                f"worker {w.worker_id} (pid {w.pid}): max rss={w.max_rss_kb / 1024:.1f}MB "
+                f"import={imports:.1f}ms"
+            )
+            for name, trace in w.error_tracebacks.items():
+                lines.append(f"worker {w.worker_id} first {name} error:\n{trace.rstrip()}")
+        return "\n".join(lines)
+
+
+def run_load_test(
+    requests: int,
+    concurrency: int = 1,
+    *,
+    recent_ratio: float = 0.0,
+    cold_start: bool = False,
+    seed: Optional[int] = None,
+) -> LoadTestReport:
+    """Replay generated connect events against the vanify handlers.
+
+    Each worker runs in its own process with its own in-memory store,
+    much like a warm lambda container.
+
+    Args:
+        requests: total calls to make.
+        concurrency: number of worker processes.
+            When less than one, calls are made in the current process.
+        recent_ratio: fraction of calls that should hit `app.recent`.
+        cold_start: re-import the app module before every call.
+        seed: random seed, for reproducible runs.
+
+    Returns:
+        Aggregated load test report.
+
+    """
+    calls = list(generate_calls(requests, recent_ratio=recent_ratio, seed=seed))
+    n_workers = max(concurrency, 1)
+    specs = [
+        WorkerSpec(worker_id=i, calls=calls[i::n_workers], cold_start=cold_start)
+        for i in range(n_workers)
+    ]
+    start = time.perf_counter()
+    if concurrency < 1:
+        workers = [run_worker(specs[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            workers = list(pool.map(run_worker, specs))
+    return LoadTestReport(workers=workers, elapsed=time.perf_counter() - start)
@@ -0,0 +1,97 @@
+"""In-memory stand-in for the vanify DynamoDB model."""
+
+import zlib
+from datetime import datetime, timezone
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Set, Tuple
+
+import attr
+from pynamodb.constants import DATETIME_FORMAT
+
+
+@attr.s(auto_attribs=True)
+class InMemoryVanifyModel:
+    """Drop-in replacement for `VanifyModel` backed by a process local dict.
+
+    Supports the subset of the model api used by `vanify.app`.
+
+    """
+
+    _items: ClassVar[Dict[Tuple[str, str], "InMemoryVanifyModel"]] = {}
+
+    contact_id: str
+    caller_id: str
+    date: Optional[datetime] = None
+    input: Optional[str] = None
+    results: Set[str] = attr.ib(factory=set)
+
+    def save(self):
+        """Store item, replacing any item with the same keys."""
+        self._items[(self.contact_id, self.caller_id)] = self
+
+    @property
+    def key(self) -> Dict[str, Dict[str, Any]]:
+        """DynamoDB formatted primary key."""
+        return {"contactId": {"S": self.contact_id}, "callerId": {"S": self.caller_id}}
+
+    @classmethod
+    def scan(
+        cls,
+        segment: Optional[int] = None,
+        total_segments: Optional[int] = None,
+        limit: Optional[int] = None,
+        last_evaluated_key: Optional[Dict[str, Dict[str, Any]]] = None,
+        **kwargs,
+    ) -> "ScanIterator":
+        """Iterate stored items in insertion order.
+
+        Mirrors DynamoDB parallel scan, items are assigned to segments by a
+        stable hash of their hash key.
+
+        """
+        items = list(cls._items.values())
+        if total_segments:
+            items = [
+                i for i in items if zlib.crc32(i.contact_id.encode()) % total_segments == segment
+            ]
+        if last_evaluated_key:
+            keys = [i.key for i in items]
+            items = items[keys.index(last_evaluated_key) + 1 :]
+        return ScanIterator(items, limit=limit)
+
+    @classmethod
+    def count(cls) -> int:
+        return len(cls._items)
+
+    @classmethod
+    def reset(cls):
+        """Remove all stored items."""
+        cls._items.clear()
+
+    def as_dict(self):
+        """Dump instance as dict."""
+        attrs = attr.asdict(self)
+        attrs["date"] = self.date.astimezone(timezone.utc).strftime(DATETIME_FORMAT)
+        attrs["results"] = list(self.results)
+        return attrs
+
+
+class ScanIterator:
+    """Scan results tracking `last_evaluated_key`, like pynamodb's `ResultIterator`."""
+
+    def __init__(self, items: List[InMemoryVanifyModel], limit: Optional[int] = None):
+        self._items = items
+        self._limit = len(items) if limit is None else min(limit, len(items))
+        self._index = 0
+        self.last_evaluated_key: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def __iter__(self) -> Iterator[InMemoryVanifyModel]:
+        return self
+
+    def __next__(self) -> InMemoryVanifyModel:
+        if self._index >= self._limit:
+            raise StopIteration
+        item = self._items[self._index]
+        self._index += 1
+        # exhausted scans have no key to resume from.
+        self.last_evaluated_key = item.key if self._index < len(self._items) else None
+        return item
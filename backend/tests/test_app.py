@@ -1,9 +1,11 @@
 import json
+import time
 from datetime import datetime
+from pathlib import Path
 
 import pytest
 from pytest_mock import MockFixture
-from vanify import app
+from vanify import app, profiling
 
 
 @pytest.fixture
@@ -21,3 +23,56 @@ def test_recent(mocker: MockFixture, mock_vanify_model):
     resp_body = json.loads(resp["body"])
     assert resp["statusCode"] == 200
     assert resp_body == {"recent": [{"date": "today"}]}
+
+
+def test_handler(mocker: MockFixture, mock_vanify_model):
+    mock_model, _ = mock_vanify_model
+    event = json.loads((Path(__file__).parent.parent / "mock.json").read_text())
+    event["Details"]["Parameters"]["inputNumber"] = "+18002626688"
+    resp = app.handler(event, mocker.MagicMock())
+    results = resp["results"].split(",")
+    assert "1-800-COCONUT" in results
+    assert resp["prompt_response"].startswith("<speak>")
+    mock_model.return_value.save.assert_called_once()
+    assert mock_model.return_value.results == results
+
+
+def test_handler_profile(mocker: MockFixture, mock_vanify_model, tmp_path, monkeypatch):
+    monkeypatch.delenv(profiling.PROFILE_RATE_ENV, raising=False)
+    monkeypatch.setenv(profiling.PROFILE_SINK_ENV, f"file://{tmp_path}")
+    monkeypatch.setenv(profiling.PROFILE_INTERVAL_ENV, "0.001")
+    mock_model, _ = mock_vanify_model
+    # keep the handler busy for a few sample intervals.
+    mock_model.return_value.save.side_effect = lambda: time.sleep(0.02)
+    event = json.loads((Path(__file__).parent.parent / "mock.json").read_text())
+    contact_id = event["Details"]["ContactData"]["ContactId"]
+    app.handler(event, mocker.MagicMock())
+    assert not list(tmp_path.iterdir())
+
+    event["Details"]["ContactData"]["Attributes"][profiling.PROFILE_ATTRIBUTE] = "true"
+    app.handler(event, mocker.MagicMock())
+    (profile_path,) = tmp_path.glob(f"{contact_id}-*.collapsed")
+    profile = profile_path.read_text()
+    stack, count = profile.splitlines()[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert "app:handler" in stack
+
+    app.handler(event, mocker.MagicMock())
+    assert len(list(tmp_path.glob(f"{contact_id}-*.collapsed"))) == 2
+
+
+@pytest.mark.parametrize(
+    "env,value",
+    [("PROFILE_RATE_ENV", ""), ("PROFILE_RATE_ENV", "10%"), ("PROFILE_INTERVAL_ENV", "0")],
+)
+def test_handler_profile_invalid_env(
+    mocker: MockFixture, mock_vanify_model, tmp_path, monkeypatch, env: str, value: str
+):
+    monkeypatch.setenv(profiling.PROFILE_SINK_ENV, f"file://{tmp_path}")
+    monkeypatch.setenv(getattr(profiling, env), value)
+    event = json.loads((Path(__file__).parent.parent / "mock.json").read_text())
+    event["Details"]["ContactData"]["Attributes"][profiling.PROFILE_ATTRIBUTE] = "true"
+    event["Details"]["Parameters"]["inputNumber"] = "+18002626688"
+    resp = app.handler(event, mocker.MagicMock())
+    assert "1-800-COCONUT" in resp["results"].split(",")
+    assert not list(tmp_path.iterdir())
@@ -14,9 +14,10 @@ samples = {
 }
 
 
+@pytest.mark.parametrize("engine", ["bfs", "dfs", "segment"])
 @pytest.mark.parametrize("word,number", list(samples.items()))
-def test_convert(word: str, number: str):
-    res = convert.VanifiedResult.from_phone_number(number, 10)
+def test_convert(word: str, number: str, engine: str):
+    res = convert.VanifiedResult.from_phone_number(number, 10, engine=engine)
     pprint(res.node_results)
     for n in res.node_results:
         print(n.score, n)
@@ -40,11 +41,184 @@ def test_convert(word: str, number: str):
         ),
     ],
 )
-def test_convert_word_results(word: str, expect: str):
-    res = convert.VanifiedResult.from_phone_number(samples[word])
+@pytest.mark.parametrize("engine", ["bfs", "dfs", "segment"])
+def test_convert_word_results(word: str, expect: str, engine: str):
+    res = convert.VanifiedResult.from_phone_number(samples[word], engine=engine)
     w_results = res.word_results
     assert expect in w_results
 
 
+def test_depth_first_frontier():
+    bfs = convert.VanifiedResult.from_numbers(samples["COCONUT"], engine="bfs")
+    dfs = convert.VanifiedResult.from_numbers(samples["COCONUT"], engine="dfs")
+    assert dfs.search_stats.completed == bfs.search_stats.completed
+    assert dfs.search_stats.peak_frontier < bfs.search_stats.peak_frontier
+    assert dfs.search_stats.peak_frontier <= len(samples["COCONUT"]) * 4
+
+
+def test_depth_first_is_lazy():
+    res = convert.VanifiedResult()
+    nodes = res.iter_depth_first(samples["COCONUT"])
+    first = next(nodes)
+    assert first.current_index == len(samples["COCONUT"])
+    assert res.search_stats.completed == 1
+
+
+@pytest.mark.parametrize(
+    "number,expect",
+    [
+        ("18002626688", ("1", "800", "2626688")),
+        ("+12142565172", ("1", "214", "2565172")),
+        ("+442079460958", ("44", "20", "79460958")),
+    ],
+)
+def test_number_parts(number: str, expect: tuple):
+    parts = convert.NumberParts.from_phone_number(number)
+    assert parts == expect
+    assert parts.digits == "".join(expect)
+
+
+def test_subscriber_only_search():
+    number = "+12142565172"
+    res = convert.VanifiedResult.from_phone_number(number, engine="dfs")
+    assert all(r.startswith("1-214-") for r in res.word_results)
+    res_area = convert.VanifiedResult.from_phone_number(number, engine="dfs", search_area_code=True)
+    assert not all(r.startswith("1-214-") for r in res_area.word_results)
+    assert res.search_stats.expanded < res_area.search_stats.expanded
+
+
+def test_segment_bounds():
+    assert convert.segment_bounds("18002264103", 4) == [4, 7, 11]
+    assert convert.segment_bounds("2264", 0) == [0, 4]
+
+
+def test_combine_blocks():
+    left = [convert.BlockCandidate("BAN", 3, 3, 3), convert.BlockCandidate("226", 0, 0, 0)]
+    right = [
+        convert.BlockCandidate("GOOD", 4, 4, 4),
+        convert.BlockCandidate("4ON", 2, 2, 0),
+        convert.BlockCandidate("4103", 0, 0, 0),
+    ]
+    nodes = list(convert.combine_blocks("1800", left, right))
+    # letters running across the boundary are left to the crossing search.
+    assert [n.current_wordified for n in nodes] == [
+        "1800BAN4ON",
+        "1800BAN4103",
+        "1800226GOOD",
+        "18002264ON",
+    ]
+    assert (nodes[0].n_chars, nodes[0].max_cont_chars, nodes[0].max_substring_length) == (5, 3, 3)
+
+
+@pytest.mark.parametrize(
+    "number",
+    [
+        "17935220328",
+        "17694561986",
+        "14142787351",
+        "13907279394",
+        "18863592574",
+        "19432243611",
+        "12142565172",
+        *samples.values(),
+    ],
+)
+def test_segment_ranks_match_depth_first(number: str):
+    dfs = convert.VanifiedResult.from_phone_number(number, engine="dfs")
+    segment = convert.VanifiedResult.from_phone_number(number, engine="segment")
+    assert sorted(n.rank for n in segment.node_results) == sorted(n.rank for n in dfs.node_results)
+    assert segment.search_stats.expanded <= dfs.search_stats.expanded
+    dfs_all = convert.VanifiedResult.from_phone_number(number, 1000, engine="dfs")
+    segment_all = convert.VanifiedResult.from_phone_number(number, 1000, engine="segment")
+    assert {n.current_wordified: n.rank for n in segment_all.node_results} == {
+        n.current_wordified: n.rank for n in dfs_all.node_results
+    }
+
+
+def test_segment_matches_depth_first():
+    number = samples["COCONUT"]
+    dfs = convert.VanifiedResult.from_phone_number(number, engine="dfs")
+    segment = convert.VanifiedResult.from_phone_number(number, engine="segment")
+    assert segment.word_results == dfs.word_results
+    assert segment.search_stats.expanded < dfs.search_stats.expanded
+
+
+def test_word_query_cache():
+    cache = convert.WordQueryCache(maxsize=2)
+    calls = []
+
+    def _compute(value):
+        calls.append(value)
+        return value.lower()
+
+    assert cache.lookup(1, "word", "A", _compute) == "a"
+    assert cache.lookup(1, "word", "A", _compute) == "a"
+    cache.lookup(1, "word", "B", _compute)
+    cache.lookup(1, "word", "C", _compute)
+    assert calls == ["A", "B", "C"]
+    assert cache.stats == convert.QueryCacheStats(hits=1, misses=3, evictions=1)
+    # another dictionary.
+    cache.lookup(2, "word", "C", _compute)
+    assert calls[-1] == "C"
+    assert len(cache) == 2
+    assert cache.lookup(1, "word", "C", _compute) == "c"
+    assert cache.stats.hits == 2
+
+
+def test_word_query_cache_shared():
+    convert.word_query_cache.clear()
+    convert.VanifiedResult().is_valid_word("CALLNOW")
+    res = convert.VanifiedResult()
+    assert res.words_tree is convert.load_words_tree()
+    assert res.is_valid_word("CALLNOW")
+    assert res.find_word_substrings("CALLNOW") == ["CALL", "NOW"]
+    assert convert.word_query_cache.stats.hits >= 1
+
+
+def test_word_query_cache_single_entry():
+    convert.word_query_cache.clear()
+    res = convert.VanifiedResult(words_tree=convert.VersionedTrie(CALL=True))
+    assert not res.is_valid_word("CALLNOW")
+    assert convert.word_query_cache.stats.misses == 1
+    assert len(convert.word_query_cache) == 1
+
+
+def test_word_query_cache_rebuilt_tries():
+    convert.word_query_cache.clear()
+    for idx in range(200):
+        words = dict(CALL=True, NOW=True) if idx % 2 else dict(CALL=True)
+        res = convert.VanifiedResult(words_tree=convert.VersionedTrie(**words))
+        assert res.is_valid_word("CALLNOW") == bool(idx % 2)
+        del res
+
+
+def test_word_query_cache_plain_trie():
+    convert.word_query_cache.clear()
+    trie = convert.pygtrie.Trie(CALL=True)
+    res = convert.VanifiedResult(words_tree=trie)
+    assert res.words_tree is trie
+    assert not res.is_valid_word("CALLNOW")
+    trie["NOW"] = True
+    assert res.is_valid_word("CALLNOW")
+    assert len(convert.word_query_cache) == 0
+
+
+def test_word_query_cache_modified_trie():
+    trie = convert.VersionedTrie(CALL=True)
+    res = convert.VanifiedResult(words_tree=trie)
+    assert not res.is_valid_word("CALLNOW")
+    trie["NOW"] = True
+    assert res.is_valid_word("CALLNOW")
+    del trie["NOW"]
+    assert not res.is_valid_word("CALLNOW")
+
+
+def test_word_results_cached():
+    res = convert.VanifiedResult.from_phone_number(samples["BAN"])
+    assert res.word_results is res.word_results
+    res.node_results = [convert.WordNode("1800BAN4103")]
+    assert res.word_results == ["1-800-BAN-4103"]
+
+
 # def test_word_node_score():
 #     call_now = convert.WordNode(current_wordified='1800CALLNOW', current_index=11, n_chars=7, max_cont_chars=7, max_substring_length=4)
@@ -0,0 +1,99 @@
+"""History export tests."""
+
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+from export.history import CHECKPOINT_NAME, HistoryExporter, ItemWriter
+from loadtest.store import InMemoryVanifyModel
+
+
+@pytest.fixture
+def history_table():
+    InMemoryVanifyModel.reset()
+    for idx in range(25):
+        item = InMemoryVanifyModel(
+            f"contact-{idx}", "+12142565172", date=datetime.utcnow(), input="+18002626688"
+        )
+        item.results = {"1-800-COCONUT"}
+        item.save()
+    yield InMemoryVanifyModel
+    InMemoryVanifyModel.reset()
+
+
+def read_contact_ids(exporter: HistoryExporter):
+    contact_ids = []
+    for seg in range(exporter.total_segments):
+        lines = exporter.segment_path(seg).read_text().splitlines()
+        contact_ids.extend(json.loads(line)["contact_id"] for line in lines)
+    return contact_ids
+
+
+def test_export_history(tmp_path, history_table):
+    exporter = HistoryExporter(tmp_path, total_segments=3, page_size=4, model=history_table)
+    report = exporter.run()
+    assert report.total_items == 25
+    assert len([n for n in report.segment_items.values() if n]) > 1
+    assert sorted(read_contact_ids(exporter)) == sorted(f"contact-{i}" for i in range(25))
+
+
+def test_export_history_resume(tmp_path, history_table):
+    def _interrupt(segment, n_items):
+        if segment == 0:
+            raise RuntimeError("interrupted")
+
+    exporter = HistoryExporter(
+        tmp_path, total_segments=2, page_size=2, model=history_table, on_page=_interrupt
+    )
+    with pytest.raises(RuntimeError):
+        exporter.run()
+    checkpoint = json.loads((tmp_path / CHECKPOINT_NAME).read_text())
+    assert not checkpoint["segments"]["0"]["done"]
+    assert checkpoint["segments"]["1"]["done"]
+
+    exporter.on_page = None
+    report = exporter.run()
+    assert report.resumed == 2
+    assert report.segment_items[1] == 0
+    contact_ids = read_contact_ids(exporter)
+    assert len(contact_ids) == 25
+    assert len(set(contact_ids)) == 25
+
+
+def test_export_history_changed_output(tmp_path, history_table):
+    def _interrupt(segment, n_items):
+        raise RuntimeError("interrupted")
+
+    exporter = HistoryExporter(
+        tmp_path, total_segments=2, page_size=2, model=history_table, on_page=_interrupt
+    )
+    with pytest.raises(RuntimeError):
+        exporter.run()
+    with pytest.raises(ValueError):
+        HistoryExporter(tmp_path, total_segments=2, output_format="csv").run()
+
+    # lost segment output restarts the segment.
+    exporter.segment_path(0).unlink()
+    exporter.segment_path(1).write_text("")
+    exporter.on_page = None
+    exporter.run()
+    contact_ids = read_contact_ids(exporter)
+    assert sorted(contact_ids) == sorted(f"contact-{i}" for i in range(25))
+
+
+def test_export_history_csv(tmp_path, history_table):
+    exporter = HistoryExporter(tmp_path, total_segments=1, output_format="csv", model=history_table)
+    exporter.run()
+    with exporter.segment_path(0).open() as stream:
+        rows = list(csv.DictReader(stream))
+    assert len(rows) == 25
+    assert json.loads(rows[0]["results"]) == ["1-800-COCONUT"]
+
+
+def test_item_writer_abstract(tmp_path):
+    with pytest.raises(TypeError):
+        ItemWriter(io.StringIO())
+    with pytest.raises(ValueError):
+        HistoryExporter(tmp_path, output_format="xml")
@@ -0,0 +1,55 @@
+"""Load test harness tests."""
+
+import logging
+import sys
+
+from loadtest import harness
+from loadtest.store import InMemoryVanifyModel
+
+
+def test_generate_calls():
+    calls = list(harness.generate_calls(20, recent_ratio=0.5, seed=1))
+    assert calls == list(harness.generate_calls(20, recent_ratio=0.5, seed=1))
+    names = {name for name, _ in calls}
+    assert names == {"handler", "recent"}
+    events = [event for name, event in calls if name == "handler"]
+    numbers = {e["Details"]["Parameters"]["inputNumber"] for e in events}
+    assert len(numbers) == len(events)
+
+
+def test_run_load_test():
+    app_logger = logging.getLogger("vanify.app")
+    level, handlers = app_logger.level, list(app_logger.handlers)
+    report = harness.run_load_test(3, 0, recent_ratio=0.3, seed=4)
+    assert (app_logger.level, app_logger.handlers) == (level, handlers)
+    assert report.total_requests == 3
+    assert sum(w.errors for w in report.workers) == 0
+    assert InMemoryVanifyModel.count() == len(report.latencies("handler"))
+    assert "req/s" in report.render()
+
+
+def test_run_load_test_cold_start():
+    from vanify import app
+
+    report = harness.run_load_test(2, 0, cold_start=True, seed=4)
+    assert len(report.workers[0].import_seconds) == 2
+    assert sys.modules["vanify.app"] is app
+
+
+def test_run_load_test_errors(mocker):
+    mocker.patch.object(InMemoryVanifyModel, "save", side_effect=RuntimeError("boom"))
+    report = harness.run_load_test(2, 0, seed=4)
+    worker = report.workers[0]
+    assert worker.errors == 2
+    assert list(worker.error_tracebacks) == ["handler"]
+    assert "RuntimeError: boom" in worker.error_tracebacks["handler"]
+    assert "RuntimeError: boom" in report.render()
+
+
+def test_report_histogram():
+    values = [0.0005, 0.004, 0.004, 7.5]
+    assert harness.LoadTestReport.percentile(values, 50) == 0.004
+    buckets = dict(harness.LoadTestReport.histogram(values))
+    assert buckets[1] == 1
+    assert buckets[5] == 2
+    assert buckets[float("inf")] == 1
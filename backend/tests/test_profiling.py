@@ -0,0 +1,60 @@
+"""Profiling tests."""
+
+import pytest
+from pytest_mock import MockFixture
+from vanify import profiling
+
+
+def _busy(n: int):
+    return sum(i * i for i in range(n))
+
+
+def test_stack_sampler():
+    sampler = profiling.StackSampler(interval=0.001)
+    sampler.start()
+    _busy(2_000_000)
+    sampler.stop()
+    lines = sampler.collapsed().splitlines()
+    assert lines
+    assert any("test_profiling:_busy" in line for line in lines)
+
+
+@pytest.mark.parametrize(
+    "rate,attributes,expect",
+    [
+        (0.0, {}, False),
+        (1.0, {}, True),
+        (0.0, {profiling.PROFILE_ATTRIBUTE: "true"}, True),
+    ],
+)
+def test_should_profile(rate, attributes, expect):
+    config = profiling.ProfileConfig(rate=rate)
+    event = {"Details": {"ContactData": {"Attributes": attributes}}}
+    assert config.should_profile(event) is expect
+
+
+def test_s3_sink(mocker: MockFixture):
+    sink = profiling.sink_from_uri("s3://profiles/vanify/")
+    sink._client = mocker.MagicMock()
+    assert sink.write("contact-id", "a;b 1\n") == "s3://profiles/vanify/contact-id.collapsed"
+    sink.client.put_object.assert_called_once_with(
+        Bucket="profiles", Key="vanify/contact-id.collapsed", Body=b"a;b 1\n"
+    )
+
+
+def test_profile_key():
+    event = {"Details": {"ContactData": {"ContactId": "../../etc/passwd"}}}
+    key = profiling.profile_key(event)
+    assert key.startswith("______etc_passwd-")
+    assert "/" not in key and "." not in key
+    assert profiling.profile_key({}).startswith("unknown-")
+
+
+def test_file_sink(tmp_path):
+    sink = profiling.sink_from_uri(f"file://{tmp_path}")
+    assert sink.write("contact-id", "a;b 1\n") == str(tmp_path / "contact-id.collapsed")
+    for key in ("..", "../contact-id", ""):
+        with pytest.raises(ValueError):
+            sink.write(key, "a;b 1\n")
+    with pytest.raises(ValueError):
+        profiling.sink_from_uri("file://tmp/vanify-profiles")
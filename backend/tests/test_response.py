@@ -0,0 +1,30 @@
+"""Response builder tests."""
+
+import pytest
+from vanify import response
+
+
+@pytest.mark.parametrize(
+    "word_results",
+    [
+        ["1-800-BAN-4103", "1-800-CAN-4103"],
+        ["1-800-COCONUT"],
+        [],
+    ],
+)
+def test_build_response(word_results):
+    tmpl = '<say-as interpret-as="telephone">{}</say-as>'
+    prompt_body = ", ".join([tmpl.format(r) for r in word_results])
+    expect_prompt = (
+        f"<speak>Five vanity numbers available for {tmpl.format('+18002264103')} "
+        f"are: {prompt_body} </speak>"
+    )
+    resp = response.build_response("+18002264103", word_results)
+    assert resp == {"results": ",".join(word_results), "prompt_response": expect_prompt}
+
+
+def test_build_responses():
+    items = [("+18002264103", ["1-800-BAN-4103"]), ("+18002626688", ["1-800-COCONUT"])]
+    resps = response.build_responses(items)
+    assert [r["results"] for r in resps] == ["1-800-BAN-4103", "1-800-COCONUT"]
+    assert "+18002626688" in resps[1]["prompt_response"]
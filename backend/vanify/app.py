@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Any, Dict, TypedDict
 
 import phonenumbers
-from vanify import convert
+from vanify import convert, profiling, response
 from vanify.models import VanifyModel
 from vanify.types import ConnectContactFlowEvent
 
@@ -31,6 +31,7 @@ def create_vanify_entry(params: VanifyParams, contact_id: str, caller_id: str):
     return inst
 
 
+@profiling.profile_handler
 def handler(event: ConnectContactFlowEvent, context):
     """Vanify entrypoint."""
     logger.info("entering vanify handler: %s %s", event, context)
@@ -38,17 +39,11 @@ def handler(event: ConnectContactFlowEvent, context):
     contact_id = event["Details"]["ContactData"]["ContactId"]
     caller_id = event["Details"]["ContactData"]["CustomerEndpoint"]["Address"]
     inst = create_vanify_entry(params, contact_id, caller_id)
-    result = convert.VanifiedResult.from_phone_number(params["inputNumber"], 5)
+    result = convert.VanifiedResult.from_phone_number(params["inputNumber"], 5, engine="dfs")
     inst.results = result.word_results
     inst.save()
     logger.info("created new vanify db entry: %s", inst.__dict__)
-    # create response item.
-    resp_body = ",".join(result.word_results)
-    prompt_as_tel_tmpl = '<say-as interpret-as="telephone">{}</say-as>'
-    prompt_body_resp = ", ".join([prompt_as_tel_tmpl.format(r) for r in result.word_results])
-    prompt_resp = f'<speak>Five vanity numbers available for {prompt_as_tel_tmpl.format(params["inputNumber"])} are: {prompt_body_resp} </speak>'
-    body = {"results": resp_body, "prompt_response": prompt_resp}
-    return body
+    return response.build_response(params["inputNumber"], result.word_results)
 
 
 def http_response(body: Dict[str, Any], status=200):
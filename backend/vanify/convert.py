@@ -1,11 +1,26 @@
 """AWS Connect Vanify Convert."""
 
+import heapq
+import itertools
 import logging
 import sys
-from collections import deque
+import threading
+from collections import OrderedDict, deque
 from pathlib import Path
 from queue import PriorityQueue
-from typing import Deque, Dict, Iterator, List, NamedTuple, Optional
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 import attr
 import phonenumbers
@@ -27,12 +42,70 @@ class ValidationState(NamedTuple):
     max_substring_length: int = 0
 
 
+@attr.s(auto_attribs=True)
+class SearchStats:
+    """Counters collected while searching for word nodes."""
+
+    # max number of partial nodes held at once.
+    peak_frontier: int = 0
+    expanded: int = 0
+    completed: int = 0
+
+    def record_frontier(self, size: int):
+        """Record current frontier size."""
+        self.peak_frontier = max(self.peak_frontier, size)
+
+
+class NumberParts(NamedTuple):
+    """Tuple for the structural parts of a phone number."""
+
+    country_code: str
+    area_code: str
+    subscriber: str
+
+    @property
+    def digits(self) -> str:
+        return self.country_code + self.area_code + self.subscriber
+
+    @classmethod
+    def from_phone_number(cls, number: str, region: str = "US") -> "NumberParts":
+        """Split phone number using `phonenumbers` metadata.
+
+        Examples:
+            >>> NumberParts.from_phone_number('+18002626688')
+            NumberParts(country_code='1', area_code='800', subscriber='2626688')
+
+        """
+        number_obj = phonenumbers.parse(number, region)
+        national = phonenumbers.national_significant_number(number_obj)
+        area_code_length = phonenumbers.length_of_national_destination_code(number_obj)
+        return cls(
+            country_code=str(number_obj.country_code),
+            area_code=national[:area_code_length],
+            subscriber=national[area_code_length:],
+        )
+
+
+class BlockCandidate(NamedTuple):
+    """Tuple for a wordified block and its validation counts."""
+
+    wordified: str
+    n_chars: int
+    max_cont: int
+    max_substring_length: int
+
+
 class WordNodeComp(NamedTuple):
     eq: bool
     lt: bool
     gt: bool
 
 
+SearchEngine = Literal["bfs", "dfs", "segment"]
+
+# length of the trailing line number block.
+LINE_NUMBER_LENGTH = 4
+
 PHONE_ALPHA_MAP = {
     k: list(v)
     for k, v in {
@@ -50,6 +123,204 @@ PHONE_ALPHA_MAP = {
 }
 
 
+_trie_versions = itertools.count()
+
+
+class VersionedTrie(pygtrie.Trie):
+    """Trie stamped with a version, renewed whenever it is modified.
+
+    Versions are never reused, so memoized queries keyed by version are
+    never served for another dictionary, or for an out of date one.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.version = next(_trie_versions)
+        super().__init__(*args, **kwargs)
+
+    def _modified(self):
+        self.version = next(_trie_versions)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._modified()
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._modified()
+        return value
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._modified()
+
+    def pop(self, *args, **kwargs):
+        value = super().pop(*args, **kwargs)
+        self._modified()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._modified()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._modified()
+
+    def merge(self, *args, **kwargs):
+        super().merge(*args, **kwargs)
+        self._modified()
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._modified()
+
+
+WORDS_PATH = Path(__file__).parent / "words.txt"
+
+_words_trees: Dict[Tuple[str, int, int], VersionedTrie] = {}
+
+
+def load_words_tree(path: Path = WORDS_PATH) -> VersionedTrie:
+    """Load dictionary trie from `path`, reusing it while the file is unchanged."""
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    tree = _words_trees.get(key)
+    if tree is None:
+        word_list = path.read_text().splitlines()
+        tree = VersionedTrie(
+            (w.rstrip().upper(), True) for w in word_list if 9 >= len(w.strip()) > 2
+        )
+        _words_trees.clear()
+        _words_trees[key] = tree
+    return tree
+
+
+@attr.s(auto_attribs=True)
+class QueryCacheStats:
+    """Counters for `WordQueryCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@attr.s(auto_attribs=True)
+class WordQueryCache:
+    """Bounded LRU memo for dictionary queries.
+
+    Shared across `VanifiedResult` instances, so results survive between
+    invocations in a warm container. Entries are keyed by dictionary
+    version, entries of replaced or modified dictionaries are never hit
+    again and age out.
+
+    """
+
+    maxsize: int = 2 ** 16
+    stats: QueryCacheStats = attr.ib(factory=QueryCacheStats)
+    _entries: "OrderedDict[Tuple[int, str, str], Any]" = attr.ib(factory=OrderedDict, repr=False)
+    _lock: threading.Lock = attr.ib(factory=threading.Lock, repr=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, version: int, kind: str, value: str, compute: Callable[[str], Any]):
+        """Retrieve memoized query result, computing it on a miss.
+
+        Args:
+            version: dictionary version the query is made against.
+            kind: query kind.
+            value: query value.
+            compute: function computing the result from `value`.
+
+        Returns:
+            Query result.
+
+        """
+        key = (version, kind, value)
+        with self._lock:
+            try:
+                result = self._entries[key]
+            except KeyError:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+                self._entries.move_to_end(key)
+                return result
+        result = compute(value)
+        with self._lock:
+            self._entries[key] = result
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+        return result
+
+    def clear(self):
+        """Drop all entries and reset stats."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = QueryCacheStats()
+
+
+word_query_cache = WordQueryCache()
+
+
+def segment_bounds(number: str, fixed_digits: int = 0) -> List[int]:
+    """Block boundaries of the searchable part of `number`.
+
+    The subscriber number is split into the exchange and the trailing line number.
+
+    Examples:
+        >>> segment_bounds('18002264103', 4)
+        [4, 7, 11]
+
+    """
+    bounds = [fixed_digits, len(number)]
+    line_start = len(number) - LINE_NUMBER_LENGTH
+    if line_start > fixed_digits:
+        bounds.insert(1, line_start)
+    return bounds
+
+
+def combine_blocks(
+    prefix: str, left: List[BlockCandidate], right: List[BlockCandidate]
+) -> Iterator["WordNode"]:
+    """Combine left and right block candidates into complete word nodes.
+
+    Pairs whose letters would run together across the block boundary are
+    skipped, these are found by continuing the search across it.
+    Pairs without any letters are skipped as invalid.
+
+    Args:
+        prefix: fixed leading digits.
+        left: candidates of the left block.
+        right: candidates of the right block.
+
+    Yields:
+        Complete word nodes, with validation state derived from the blocks.
+
+    """
+    for lc in left:
+        left_open = lc.wordified[-1].isalpha()
+        for rc in right:
+            if (left_open and rc.wordified[0].isalpha()) or not (lc.n_chars + rc.n_chars):
+                continue
+            wordified = prefix + lc.wordified + rc.wordified
+            yield WordNode(
+                wordified,
+                current_index=len(wordified),
+                n_chars=lc.n_chars + rc.n_chars,
+                max_cont_chars=max(lc.max_cont, rc.max_cont),
+                max_substring_length=max(lc.max_substring_length, rc.max_substring_length),
+            )
+
+
 @attr.s(auto_attribs=True, order=False)
 class WordNode:
     current_wordified: str
@@ -178,6 +449,11 @@ class WordNode:
             except IndexError:
                 yield c
 
+    @property
+    def rank(self) -> Tuple[int, int, int, int]:
+        """Sortable rank, by score then word node comparison order."""
+        return self.score, self.max_substring_length, self.max_cont_chars, self.n_chars
+
     def update_from_state(self, state: ValidationState):
         """Update values from validation state."""
         self.max_substring_length = state.max_substring_length
@@ -186,26 +462,44 @@ class WordNode:
 
 @attr.s(kw_only=True, auto_attribs=True)
 class VanifiedResult:
-    node_results: List[WordNode] = attr.ib(factory=list)
+    node_results: List[WordNode] = attr.ib(
+        factory=list, on_setattr=lambda inst, _, value: inst._reset_rendered(value)
+    )
     words_queue: PriorityQueue = attr.ib(init=False)
+    # queries are memoized for `VersionedTrie` dictionaries, plain tries are queried directly.
     words_tree: Optional[pygtrie.Trie] = attr.ib(repr=None, default=None)
-    _words: List[str] = attr.ib(init=False, factory=list, repr=False)
+    search_stats: SearchStats = attr.ib(factory=SearchStats)
+    _word_results: Optional[List[str]] = attr.ib(init=False, default=None, repr=False)
 
     max_results: int = 5
 
     def __attrs_post_init__(self):
         self.words_queue = PriorityQueue(maxsize=0)
         if not self.words_tree:
-            root = Path(__file__).parent
-            word_list = (root / "words.txt").read_text().splitlines()
-            self._words = [w.rstrip().upper() for w in word_list if 9 >= len(w.strip()) > 2]
-            self.words_tree = pygtrie.Trie()
-            for w in self._words:
-                self.words_tree[w] = True
+            self.words_tree = load_words_tree()
+
+    def _query(self, kind: str, value: str, compute: Callable[[str], Any]):
+        """Run dictionary query, memoized in `word_query_cache` for versioned dictionaries."""
+        if not isinstance(self.words_tree, VersionedTrie):
+            # plain tries can't report modifications.
+            return compute(value)
+        return word_query_cache.lookup(self.words_tree.version, kind, value, compute)
+
+    def _reset_rendered(self, node_results: List[WordNode]) -> List[WordNode]:
+        self._word_results = None
+        return node_results
 
     @property
     def word_results(self) -> List[str]:
-        return ["".join(n.as_phonenumber) for n in self.node_results]
+        """Node results formatted as phone numbers.
+
+        Rendered once, and again only after `node_results` is reassigned.
+        Mutating `node_results` in place does not re-render them.
+
+        """
+        if self._word_results is None:
+            self._word_results = ["".join(n.as_phonenumber) for n in self.node_results]
+        return self._word_results
 
     def ensure_put(self, value: WordNode):
         logger.debug("pushing into pqueue: %s", value)
@@ -287,6 +581,9 @@ class VanifiedResult:
             True if valid, False otherwise
 
         """
+        return self._query("word_or_prefix", value, self._is_valid_word_or_prefix)
+
+    def _is_valid_word_or_prefix(self, value: str) -> bool:
         if self.words_tree.has_key(value) or self.words_tree.has_subtrie(value):
             return True
         for idx, _ in enumerate(value):
@@ -305,99 +602,340 @@ class VanifiedResult:
 
 
         """
+        return list(self._query("substrings", value, self._find_word_substrings))
+
+    def _find_word_substrings(self, value: str) -> Tuple[str, ...]:
         if self.words_tree.has_key(value):
-            return [value]
+            return (value,)
         for idx, _ in enumerate(value):
             right = value[: idx + 1]
             left = value[idx + 1 :]
             if self.words_tree.has_key(left) and self.words_tree.has_key(right):
-                return [right, left]
-        return []
+                return (right, left)
+        return ()
 
     def is_valid_word(self, value: str) -> bool:
-        return any(self.find_word_substrings(value))
+        return self._query("word", value, lambda v: any(self._find_word_substrings(v)))
 
     @classmethod
-    def from_phone_number(cls, number: str, *args):
-        """Create vanified result from phone number."""
-        number_obj = phonenumbers.parse(number, "US")
-        parsed_number = phonenumbers.format_number(number_obj, phonenumbers.PhoneNumberFormat.E164)
-        return cls.from_numbers(parsed_number.lstrip("+"), *args)
+    def from_phone_number(cls, number: str, *args, search_area_code: bool = False, **kwargs):
+        """Create vanified result from phone number.
 
-    @classmethod
-    def from_numbers(cls, number: str, max_results: int = 5):
-        """Convert input numbers to tele-words.
+        Only the subscriber portion of the number is searched by default,
+        the country and area codes are kept as digits.
+
+        Args:
+            number: input phone number.
+            *args: args passed to `VanifiedResult.from_numbers`
+            search_area_code: also search the area code for words.
+            **kwargs: kwargs passed to `VanifiedResult.from_numbers`
+
+        """
+        parts = NumberParts.from_phone_number(number)
+        fixed_digits = len(parts.country_code)
+        if not search_area_code:
+            fixed_digits += len(parts.area_code)
+        return cls.from_numbers(parts.digits, *args, fixed_digits=fixed_digits, **kwargs)
+
+    def expand_node(self, number: str, node: WordNode) -> Iterator[WordNode]:
+        """Iterate child nodes of `node` that may still form valid words.
 
         Args:
             number: input numbers.
-            max_results: max results to return.
+            node: partial word node to expand.
+
+        Yields:
+            Word node for each viable char at the node's current index.
+
+        """
+        num_digits = len(number)
+        cur_wordified = node.current_wordified
+        cur_idx = node.current_index
+        cur_digit = number[cur_idx]
+
+        char_prefix = self.find_char_prefix(cur_wordified, cur_idx - 1)
+        len_char_prefix = len(char_prefix)
+
+        for char in PHONE_ALPHA_MAP[cur_digit] + [cur_digit]:
+            is_dig_and_prefix_invalid = char.isdigit() and (
+                not len_char_prefix or self.is_valid_word(char_prefix)
+            )
+            is_alpha_and_valid_word_or_prefix = char.isalpha() and (
+                cur_idx != num_digits - 1 and self.is_valid_word_or_prefix(char_prefix + char)
+            )
+            is_alpha_and_valid_word = char.isalpha() and (
+                cur_idx == num_digits - 1 and self.is_valid_word(char_prefix + char)
+            )
+            if (
+                is_dig_and_prefix_invalid
+                or is_alpha_and_valid_word_or_prefix
+                or is_alpha_and_valid_word
+            ):
+                next_word_num = cur_wordified[:cur_idx] + char + cur_wordified[cur_idx + 1 :]
+                logger.debug("Next word: %s", next_word_num)
+                next_nchars = node.n_chars + (1 if char.isalpha() else 0)
+                v_state = self.validate(next_word_num)
+                yield WordNode(
+                    next_word_num,
+                    current_index=cur_idx + 1,
+                    n_chars=next_nchars,
+                    max_cont_chars=v_state.max_cont,
+                    max_substring_length=v_state.max_substring_length,
+                )
+
+    def complete_node(self, node: WordNode) -> bool:
+        """Validate a fully expanded word node and update its state.
 
         Returns:
-            VanifiedResult item.
+            True if node holds a valid word, False otherwise.
 
         """
-        results = cls(max_results=max_results)
+        valid_state = self.validate(node.current_wordified)
+        if not valid_state.valid:
+            return False
+        node.update_from_state(valid_state)
+        return True
+
+    def iter_depth_first(
+        self,
+        number: str,
+        fixed_digits: int = 0,
+        *,
+        keep: Optional[Callable[[WordNode], bool]] = None,
+        stats: Optional[SearchStats] = None,
+    ) -> Iterator[WordNode]:
+        """Lazily iterate completed word nodes, depth first.
+
+        Only the siblings along the current path are held on the stack,
+        so the frontier grows linearly with the length of `number`.
+
+        Args:
+            number: input numbers.
+            fixed_digits: count of leading digits to keep as digits.
+            keep: predicate for pruning partial nodes, if any.
+            stats: search stats to record into.
+                Defaults to `search_stats`.
+
+        Yields:
+            Valid, fully expanded word nodes.
+
+        """
+        stats = stats or self.search_stats
+        return self._depth_first(
+            number, [WordNode(number, current_index=fixed_digits)], keep=keep, stats=stats
+        )
+
+    def _depth_first(
+        self,
+        number: str,
+        roots: List[WordNode],
+        *,
+        end: Optional[int] = None,
+        keep: Optional[Callable[[WordNode], bool]] = None,
+        stats: SearchStats,
+    ) -> Iterator[WordNode]:
+        """Depth first search from `roots` down to the `end` index.
+
+        Nodes reaching the end of `number` are validated first, nodes
+        stopped short of it by `end` are yielded as is.
+
+        """
+        num_digits = len(number)
+        end = num_digits if end is None else end
+        stack: List[WordNode] = list(reversed(roots))
+
+        while stack:
+            stats.record_frontier(len(stack))
+            cur_node = stack.pop()
+            if cur_node.current_index == end != num_digits:
+                # handed over to the caller, not expanded here.
+                yield cur_node
+                continue
+            stats.expanded += 1
+
+            if cur_node.current_index == num_digits:
+                if self.complete_node(cur_node):
+                    stats.completed += 1
+                    yield cur_node
+                continue
+
+            children = self.expand_node(number, cur_node)
+            if keep:
+                children = filter(keep, children)
+            # reversed so siblings are visited in the same order as breadth first.
+            stack.extend(reversed(list(children)))
+
+    def collect_best(self, nodes: Iterable[WordNode], k: Optional[int] = None) -> List[WordNode]:
+        """Keep the top `max_results` nodes from `nodes` in a bounded heap.
+
+        Args:
+            nodes: word nodes to rank.
+            k: number of nodes to keep. Defaults to `max_results`.
 
+        Returns:
+            Best nodes, highest ranked first.
+
+        """
+        k = k or self.max_results
+        heap: List[Tuple[Tuple[int, ...], int, WordNode]] = []
+        for seq, node in enumerate(nodes):
+            # negated seq prefers earlier nodes on equal rank.
+            item = (node.rank, -seq, node)
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            else:
+                heapq.heappushpop(heap, item)
+        return [n for *_, n in sorted(heap, reverse=True)]
+
+    def _search_breadth_first(self, number: str, fixed_digits: int = 0):
+        """Search all word nodes breadth first."""
         num_digits = len(number)
         queue: Deque[WordNode] = deque([])
 
-        queue.append(WordNode(number))
+        queue.append(WordNode(number, current_index=fixed_digits))
 
         while queue:
+            self.search_stats.record_frontier(len(queue))
             cur_node = queue.popleft()
-            cur_wordified = cur_node.current_wordified
-            cur_idx = cur_node.current_index
+            self.search_stats.expanded += 1
 
-            if cur_idx == num_digits:
-                valid_state = results.validate(cur_wordified)
+            if cur_node.current_index == num_digits:
+                if self.complete_node(cur_node):
+                    self.search_stats.completed += 1
+                    self.ensure_put(cur_node)
+                continue
 
-                if not valid_state.valid:
-                    continue
+            queue.extend(self.expand_node(number, cur_node))
 
-                cur_node.update_from_state(valid_state)
-                results.ensure_put(cur_node)
-                continue
+        # return max word node having most n of cont letters
+        if self.words_queue.qsize() > 0:
+            node_results = reversed(sorted(self.words_queue.queue, key=lambda n: n.score))
+            self.node_results = list(node_results)[: self.max_results]
+
+    def _block_candidate(self, wordified: str) -> BlockCandidate:
+        # validated as followed by a digit, as it is in the combined number.
+        state = self.validate(wordified + "0")
+        return BlockCandidate(
+            wordified=wordified,
+            n_chars=sum(c.isalpha() for c in wordified),
+            max_cont=state.max_cont,
+            max_substring_length=state.max_substring_length,
+        )
 
-            cur_digit = number[cur_idx]
-            cur_n_chars_in_word = cur_node.n_chars
+    def search_left_block(
+        self, number: str, fixed_digits: int, boundary: int, stats: SearchStats
+    ) -> Tuple[List[BlockCandidate], List[WordNode]]:
+        """Search digits left of `boundary`, in the context of the whole number.
 
-            char_prefix = results.find_char_prefix(cur_wordified, cur_idx - 1)
-            len_char_prefix = len(char_prefix)
+        Returns:
+            Candidates whose words end within the block, and all partial
+            nodes reaching the boundary.
 
-            for char in PHONE_ALPHA_MAP[cur_digit] + [cur_digit]:
-                is_dig_and_prefix_invalid = char.isdigit() and (
-                    not len_char_prefix or results.is_valid_word(char_prefix)
-                )
-                is_alpha_and_valid_word_or_prefix = char.isalpha() and (
-                    cur_idx != num_digits - 1
-                    and results.is_valid_word_or_prefix(char_prefix + char)
-                )
-                is_alpha_and_valid_word = char.isalpha() and (
-                    cur_idx == num_digits - 1 and results.is_valid_word(char_prefix + char)
+        """
+        candidates: List[BlockCandidate] = []
+        roots = [WordNode(number, current_index=fixed_digits)]
+        nodes = list(self._depth_first(number, roots, end=boundary, stats=stats))
+        for node in nodes:
+            char_prefix = self.find_char_prefix(node.current_wordified, boundary - 1)
+            if not char_prefix or self.is_valid_word(char_prefix):
+                candidates.append(
+                    self._block_candidate(node.current_wordified[fixed_digits:boundary])
                 )
-                if (
-                    is_dig_and_prefix_invalid
-                    or is_alpha_and_valid_word_or_prefix
-                    or is_alpha_and_valid_word
-                ):
-                    next_word_num = cur_wordified[:cur_idx] + char + cur_wordified[cur_idx + 1 :]
-                    logger.debug("Next word: %s", next_word_num)
-                    next_nchars = cur_n_chars_in_word + (1 if char.isalpha() else 0)
-                    v_state = results.validate(next_word_num)
-                    queue.append(
-                        WordNode(
-                            next_word_num,
-                            current_index=cur_idx + 1,
-                            n_chars=next_nchars,
-                            max_cont_chars=v_state.max_cont,
-                            max_substring_length=v_state.max_substring_length,
-                        )
-                    )
+        return candidates, nodes
 
-        # return max word node having most n of cont letters
-        if results.words_queue.qsize() > 0:
-            node_results = reversed(sorted(results.words_queue.queue, key=lambda n: n.score))
-            results.node_results = list(node_results)[: results.max_results]
-            return results
+    def search_right_block(self, digits: str, stats: SearchStats) -> List[BlockCandidate]:
+        """Search a block of digits whose words start and end within it.
+
+        The all digit candidate is included.
+
+        """
+        candidates = [
+            BlockCandidate(n.current_wordified, n.n_chars, n.max_cont_chars, n.max_substring_length)
+            for n in self._depth_first(digits, [WordNode(digits)], stats=stats)
+        ]
+        candidates.append(BlockCandidate(digits, 0, 0, 0))
+        return candidates
+
+    def _search_segments(self, number: str, fixed_digits: int = 0):
+        """Search the exchange and line number blocks independently, then combine them.
+
+        Words that end before the boundary are valid independently of the
+        line number, so the line number block is searched only once rather
+        than once per exchange candidate. Rank of a combined pair follows
+        from its block counts, as letter runs of both blocks stay separate.
+        Words spanning the boundary are found by continuing the search from
+        the exchange nodes whose letters are still open at the boundary.
+        Results rank exactly as with the other engines.
+
+        """
+        bounds = segment_bounds(number, fixed_digits)
+        if len(bounds) < 3:
+            self.node_results = self.collect_best(self.iter_depth_first(number, fixed_digits))
+            return
+        _, boundary, _ = bounds
+        left, boundary_nodes = self.search_left_block(
+            number, fixed_digits, boundary, self.search_stats
+        )
+        if len(left) <= 1:
+            # the line number is searched at most once either way, so just continue.
+            self.node_results = self.collect_best(
+                self._depth_first(number, boundary_nodes, stats=self.search_stats)
+            )
+            return
+        right = self.search_right_block(number[boundary:], self.search_stats)
+
+        open_nodes = [n for n in boundary_nodes if n.current_wordified[boundary - 1].isalpha()]
+
+        self.node_results = self.collect_best(
+            itertools.chain(
+                combine_blocks(number[:fixed_digits], left, right),
+                self._search_crossing(number, boundary, open_nodes),
+            )
+        )
+
+    def _search_crossing(
+        self, number: str, boundary: int, open_nodes: List[WordNode]
+    ) -> Iterator[WordNode]:
+        """Continue open exchange nodes with words spanning the boundary."""
+
+        def _crosses(node: WordNode) -> bool:
+            return node.current_index != boundary + 1 or node.current_wordified[boundary].isalpha()
+
+        return self._depth_first(number, open_nodes, keep=_crosses, stats=self.search_stats)
+
+    @classmethod
+    def from_numbers(
+        cls,
+        number: str,
+        max_results: int = 5,
+        engine: SearchEngine = "bfs",
+        fixed_digits: int = 0,
+    ):
+        """Convert input numbers to tele-words.
 
+        Args:
+            number: input numbers.
+            max_results: max results to return.
+            engine: search engine to use.
+                `bfs` expands level by level, `dfs` keeps only the
+                current path and a top-k heap in memory, `segment`
+                searches the exchange and line number independently.
+            fixed_digits: count of leading digits to keep as digits.
+
+        Returns:
+            VanifiedResult item.
+
+        """
+        results = cls(max_results=max_results)
+        if engine == "dfs":
+            results.node_results = results.collect_best(
+                results.iter_depth_first(number, fixed_digits)
+            )
+        elif engine == "bfs":
+            results._search_breadth_first(number, fixed_digits)
+        elif engine == "segment":
+            results._search_segments(number, fixed_digits)
+        else:
+            raise ValueError(f"Unknown search engine: {engine}")
+        logger.debug("search stats for %s: %s", number, results.search_stats)
         return results
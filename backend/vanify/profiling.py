@@ -0,0 +1,226 @@
+"""AWS Connect Vanify Profiling."""
+
+import functools
+import logging
+import os
+import random
+import re
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, List, Optional, Protocol
+from urllib.parse import urlparse
+
+import attr
+
+# TODO: For a real application, setup proper log handling.
+ch = logging.StreamHandler(sys.stdout)
+ch.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+logger = logging.getLogger(__name__)
+logger.addHandler(ch)
+logger.setLevel(logging.INFO)
+
+# fraction of invocations to profile.
+PROFILE_RATE_ENV = "VANIFY_PROFILE_RATE"
+# `file:///path/to/dir` or `s3://bucket/prefix`.
+PROFILE_SINK_ENV = "VANIFY_PROFILE_SINK"
+# seconds between stack samples.
+PROFILE_INTERVAL_ENV = "VANIFY_PROFILE_INTERVAL"
+# contact attribute forcing a profile of the invocation.
+PROFILE_ATTRIBUTE = "vanifyProfile"
+
+DEFAULT_SINK = "file:///tmp/vanify-profiles"
+
+# anything else in a contact id could escape the sink directory.
+UNSAFE_KEY_RE = re.compile(r"[^A-Za-z0-9_-]")
+
+
+class ProfileSink(Protocol):
+    def write(self, key: str, profile: str) -> str:
+        ...
+
+
+@attr.s(auto_attribs=True)
+class FileSink:
+    """Write profiles to a local directory."""
+
+    directory: Path
+
+    def write(self, key: str, profile: str) -> str:
+        if key in ("", ".", "..") or Path(key).name != key:
+            raise ValueError(f"Invalid profile key: {key}")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.collapsed"
+        path.write_text(profile)
+        return str(path)
+
+
+@attr.s(auto_attribs=True)
+class S3Sink:
+    """Write profiles to an S3 bucket."""
+
+    bucket: str
+    prefix: str = ""
+    _client: Optional[Any] = None
+
+    @property
+    def client(self):
+        """Lazily instantiated Boto3 S3 client."""
+        if not self._client:
+            import boto3
+
+            self._client = boto3.client("s3")
+        return self._client
+
+    def write(self, key: str, profile: str) -> str:
+        object_key = "/".join(filter(None, [self.prefix.strip("/"), f"{key}.collapsed"]))
+        self.client.put_object(Bucket=self.bucket, Key=object_key, Body=profile.encode())
+        return f"s3://{self.bucket}/{object_key}"
+
+
+def sink_from_uri(uri: str) -> ProfileSink:
+    """Create profile sink from a `file://` or `s3://` uri."""
+    parsed = urlparse(uri)
+    if parsed.scheme == "s3":
+        return S3Sink(bucket=parsed.netloc, prefix=parsed.path)
+    if parsed.scheme in ("file", ""):
+        if parsed.netloc not in ("", "localhost"):
+            raise ValueError(f"Unsupported profile sink host: {uri}, expected file:///path")
+        return FileSink(Path(parsed.path))
+    raise ValueError(f"Unsupported profile sink: {uri}")
+
+
+@attr.s(auto_attribs=True)
+class ProfileConfig:
+    """Profiling options."""
+
+    rate: float = 0.0
+    interval: float = 0.005
+    sink_uri: str = DEFAULT_SINK
+    enabled: bool = True
+
+    @classmethod
+    def from_env(cls) -> "ProfileConfig":
+        """Load options from the environment.
+
+        Malformed options disable profiling, rather than failing the invocation.
+
+        """
+        try:
+            rate = float(os.environ.get(PROFILE_RATE_ENV, 0.0))
+            interval = float(os.environ.get(PROFILE_INTERVAL_ENV, 0.005))
+            if not interval > 0:
+                raise ValueError(f"{PROFILE_INTERVAL_ENV} must be positive, got {interval}.")
+        except ValueError as e:
+            logger.warning("profiling disabled, invalid options: %s", e)
+            return cls(enabled=False)
+        return cls(
+            rate=rate,
+            interval=interval,
+            sink_uri=os.environ.get(PROFILE_SINK_ENV, DEFAULT_SINK),
+        )
+
+    def should_profile(self, event) -> bool:
+        """Check if invocation should be profiled, by event attribute or sample rate."""
+        if not self.enabled:
+            return False
+        attributes = event.get("Details", {}).get("ContactData", {}).get("Attributes") or {}
+        if str(attributes.get(PROFILE_ATTRIBUTE, "")).lower() in ("1", "true", "yes"):
+            return True
+        return self.rate > 0 and random.random() < self.rate
+
+
+@attr.s(auto_attribs=True)
+class StackSampler:
+    """Sample the call stack of a thread from a background thread.
+
+    Samples are aggregated as collapsed stacks, one `frame;frame;... count`
+    line per unique stack, ready for `flamegraph.pl` or speedscope.
+
+    """
+
+    interval: float = 0.005
+    samples: Counter = attr.ib(factory=Counter)
+    _thread_id: Optional[int] = attr.ib(default=None, repr=False)
+    _stop: threading.Event = attr.ib(factory=threading.Event, repr=False)
+    _sampler: Optional[threading.Thread] = attr.ib(default=None, repr=False)
+
+    @staticmethod
+    def frame_label(frame: FrameType) -> str:
+        code = frame.f_code
+        return f"{Path(code.co_filename).stem}:{code.co_name}:{code.co_firstlineno}"
+
+    def collapse(self, frame: Optional[FrameType]) -> str:
+        labels: List[str] = []
+        while frame is not None:
+            labels.append(self.frame_label(frame))
+            frame = frame.f_back
+        return ";".join(reversed(labels))
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self.samples[self.collapse(frame)] += 1
+
+    def start(self, thread_id: Optional[int] = None):
+        """Start sampling `thread_id`, defaulting to the current thread."""
+        self._thread_id = thread_id or threading.get_ident()
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._run, name="vanify-profiler", daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._sampler:
+            self._sampler.join()
+
+    def collapsed(self) -> str:
+        """Samples in collapsed stack format."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+def _contact_id(event) -> str:
+    try:
+        return str(event["Details"]["ContactData"]["ContactId"])
+    except (KeyError, TypeError):
+        return "unknown"
+
+
+def profile_key(event) -> str:
+    """Path safe profile key, unique to the invocation's contact id and start time."""
+    contact_id = UNSAFE_KEY_RE.sub("_", _contact_id(event))
+    return f"{contact_id}-{datetime.utcnow():%Y%m%dT%H%M%S%fZ}"
+
+
+def profile_handler(func: Callable):
+    """Profile wrapped contact flow handler when enabled.
+
+    Enabled for a `VANIFY_PROFILE_RATE` fraction of invocations, or when
+    the contact has a truthy `vanifyProfile` attribute. The collapsed stack
+    profile is written to `VANIFY_PROFILE_SINK`, keyed by contact id and time.
+
+    """
+
+    @functools.wraps(func)
+    def _wrapper(event, context):
+        config = ProfileConfig.from_env()
+        if not config.should_profile(event):
+            return func(event, context)
+        key = profile_key(event)
+        sampler = StackSampler(interval=config.interval)
+        sampler.start()
+        try:
+            return func(event, context)
+        finally:
+            sampler.stop()
+            try:
+                location = sink_from_uri(config.sink_uri).write(key, sampler.collapsed())
+                logger.info("wrote profile to %s", location)
+            except Exception:
+                logger.exception("failed to write profile %s", key)
+
+    return _wrapper
@@ -0,0 +1,36 @@
+"""AWS Connect Vanify Responses."""
+
+from typing import Iterable, List, Tuple, TypedDict
+
+SAY_AS_TELEPHONE_OPEN = '<say-as interpret-as="telephone">'
+SAY_AS_TELEPHONE_CLOSE = "</say-as>"
+PROMPT_OPEN = "<speak>Five vanity numbers available for "
+PROMPT_CLOSE = " </speak>"
+
+
+class VanifyResponse(TypedDict):
+    results: str
+    prompt_response: str
+
+
+def say_as_telephone(value: str) -> str:
+    """Wrap value in a SSML telephone `say-as` tag."""
+    return SAY_AS_TELEPHONE_OPEN + value + SAY_AS_TELEPHONE_CLOSE
+
+
+def build_prompt(input_number: str, word_results: List[str]) -> str:
+    """Build SSML prompt reading out vanity numbers for `input_number`."""
+    body = ", ".join(map(say_as_telephone, word_results))
+    return PROMPT_OPEN + say_as_telephone(input_number) + " are: " + body + PROMPT_CLOSE
+
+
+def build_response(input_number: str, word_results: List[str]) -> VanifyResponse:
+    """Build contact flow response for `input_number`."""
+    return VanifyResponse(
+        results=",".join(word_results), prompt_response=build_prompt(input_number, word_results)
+    )
+
+
+def build_responses(items: Iterable[Tuple[str, List[str]]]) -> List[VanifyResponse]:
+    """Build contact flow responses for many input number and results pairs."""
+    return [build_response(input_number, word_results) for input_number, word_results in items]